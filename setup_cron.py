@@ -6,6 +6,7 @@ This script sets up a cron job to run the daily_update.sh script every day at mi
 
 import os
 import sys
+import tempfile
 import subprocess
 import logging
 from pathlib import Path
@@ -26,29 +27,41 @@ def setup_cron_job():
         update_script = script_dir / "daily_update.sh"
         
         # Make sure the update script is executable
-        os.chmod(update_script, 0o755)
-        logger.info(f"Made {update_script} executable")
+        if os.stat(update_script).st_mode & 0o777 != 0o755:
+            os.chmod(update_script, 0o755)
+            logger.info(f"Made {update_script} executable")
         
-        # Create a temporary file with the current crontab
-        subprocess.run("crontab -l > /tmp/current_crontab 2>/dev/null || true", shell=True, check=True)
+        # Create a temporary file for the current crontab
+        with tempfile.NamedTemporaryFile(suffix=".crontab", delete=False) as f:
+            crontab_file = f.name
         
-        # Check if the job already exists
-        with open("/tmp/current_crontab", "r") as f:
-            current_crontab = f.read()
-        
-        if str(update_script) in current_crontab:
-            logger.info("Cron job already exists, skipping")
-            return
-        
-        # Add the new job to the crontab
-        with open("/tmp/current_crontab", "a") as f:
-            f.write(f"\n# Run hackathon updater daily at midnight\n0 0 * * * {update_script}\n")
-        
-        # Install the new crontab
-        subprocess.run("crontab /tmp/current_crontab", shell=True, check=True)
-        
-        # Clean up
-        os.unlink("/tmp/current_crontab")
+        try:
+            # Copy the current crontab into the temporary file
+            with open(crontab_file, "w") as f:
+                try:
+                    subprocess.run(["crontab", "-l"], stdout=f, stderr=subprocess.DEVNULL, check=False)
+                except FileNotFoundError:
+                    logger.error("crontab not installed, cannot set up the cron job")
+                    print("Error setting up cron job: crontab not installed")
+                    sys.exit(1)
+            
+            # Check if the job already exists
+            with open(crontab_file, "r") as f:
+                current_crontab = f.read()
+            
+            if str(update_script) in current_crontab:
+                logger.info("Cron job already exists, skipping")
+                return
+            
+            # Add the new job to the crontab
+            with open(crontab_file, "a") as f:
+                f.write(f"\n# Run hackathon updater daily at midnight\n0 0 * * * {update_script}\n")
+            
+            # Install the new crontab
+            subprocess.run(["crontab", crontab_file], check=True)
+        finally:
+            # Clean up
+            os.unlink(crontab_file)
         
         logger.info("Cron job set up successfully")
         print("Cron job set up successfully. The hackathon data will be updated daily at midnight.")
@@ -6,10 +6,19 @@ with the latest information, prioritizing California and online events sorted by
 """
 
 import os
+import re
+import sys
 import json
-import requests
-from datetime import datetime, timedelta
+import pickle
+import hashlib
+import asyncio
+import aiohttp
+import orjson
+from aiohttp_retry import ExponentialRetry, RetryClient
+from datetime import date, datetime, timedelta
 import logging
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from typing import List, Dict, Any, Optional
 
 # Configure logging
@@ -34,82 +43,216 @@ API_KEYS = {
     "dev_events": os.environ.get("DEV_EVENTS_API_KEY", "")
 }
 
+# HTTP cache configuration (validators and last payloads for conditional requests)
+CACHE_DIR = ".cache"
+HTTP_CACHE_FILE = os.path.join(CACHE_DIR, "http_cache.json")
+
+# Maximum time to wait for a single collector before skipping it
+COLLECTOR_TIMEOUT = 15
+
+# Retries with exponential backoff for 5xx responses and connection errors (4xx are not retried)
+RETRY_ATTEMPTS = 3
+RETRY_START_TIMEOUT = 0.5
+
+# Locations treated as California. The "CA" abbreviation only counts in a US state
+# position ("Fresno, CA", "Fresno, CA 93721", "Fresno, CA, USA"), not after a
+# province code as in "Toronto, ON, CA" where it is Canada's country code
+CALIFORNIA_LOCATION_RE = re.compile(
+    r"\b(California|Bay Area|San Francisco|Los Angeles|San Diego|San Jose|"
+    r"Oakland|Berkeley|Palo Alto|Cupertino|Santa Cruz|Irvine)\b"
+    r"|(?-i:(?:^|,)(?!\s*[A-Z]{2}\s*,)[^,]+,\s*CA(?:\s+\d{5}(?:-\d{4})?)?(?:,\s*(?:US|USA|United States))?\s*$)",
+    re.IGNORECASE
+)
+
+# README table row; the third column is the event's location or platform
+README_ROW_TEMPLATE = '| **[{title}]({url})** | {date_str} | {column} | <a href="{url}" target="_blank"><img src="https://i.imgur.com/w6lyvuC.png" width="84" alt="Apply"></a> |'
+# "Last updated" footer line, ignored when checking whether the README changed
+README_UPDATE_DATE_RE = re.compile(rb"^\*Last updated: .*\*$", re.MULTILINE)
+
+
+class HttpCache:
+    """On-disk cache of ETag/Last-Modified validators and parsed API payloads."""
+    
+    def __init__(self, cache_file: str = HTTP_CACHE_FILE):
+        self.cache_file = cache_file
+        self.cache_dir = os.path.dirname(cache_file) or "."
+        try:
+            with open(cache_file, 'r') as f:
+                self.entries: Dict[str, Dict[str, Optional[str]]] = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+    
+    def _payload_file(self, url: str) -> str:
+        """Path of the pickled payload stored for a URL."""
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode()).hexdigest() + ".pickle")
+    
+    def has_payload(self, url: str) -> bool:
+        """Whether a parsed payload is stored for a URL."""
+        return os.path.exists(self._payload_file(url))
+    
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a cached URL.
+        
+        No validators are sent without a stored payload, since a 304 would
+        then leave nothing to return.
+        """
+        if not self.has_payload(url):
+            return {}
+        entry = self.entries.get(url, {})
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+    
+    def body_hash(self, url: str) -> Optional[str]:
+        """Hash of the last response body stored for a URL."""
+        return self.entries.get(url, {}).get("body_hash")
+    
+    def load_payload(self, url: str) -> Any:
+        """Load the last parsed payload for a URL."""
+        with open(self._payload_file(url), 'rb') as f:
+            return pickle.load(f)
+    
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str], body_hash: str, payload: Any) -> None:
+        """Persist validators and the parsed payload for a URL."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        _write_atomic(self._payload_file(url), pickle.dumps(payload))
+        self.entries[url] = {"etag": etag, "last_modified": last_modified, "body_hash": body_hash}
+        self._save_entries()
+    
+    def drop(self, url: str) -> None:
+        """Forget the validators stored for a URL."""
+        if self.entries.pop(url, None) is not None:
+            self._save_entries()
+    
+    def _save_entries(self) -> None:
+        """Write the validator index to disk."""
+        _write_atomic(self.cache_file, json.dumps(self.entries, indent=2).encode())
+
+
+@dataclass(slots=True)
 class HackathonEvent:
     """Class representing a hackathon event with all necessary details."""
     
-    def __init__(
-        self,
-        title: str,
-        start_date: str,
-        end_date: str,
-        location: str,
-        url: str,
-        platform: str,
-        is_online: bool = False,
-        is_california: bool = False,
-        prize: Optional[str] = None,
-        tags: Optional[List[str]] = None
-    ):
-        self.title = title
-        self.start_date = start_date
-        self.end_date = end_date
-        self.location = location
-        self.url = url
-        self.platform = platform
-        self.is_online = is_online
-        self.is_california = is_california
-        self.prize = prize
-        self.tags = tags or []
-        
-        # Parse dates for sorting
-        try:
-            self.start_date_obj = datetime.strptime(start_date, "%Y-%m-%d")
-        except (ValueError, TypeError):
-            self.start_date_obj = datetime.max
+    title: str
+    start_date: str
+    end_date: str
+    location: str
+    url: str
+    platform: str
+    is_online: bool = False
+    is_california: bool = False
+    prize: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
     
-    def __lt__(self, other):
-        """Enable sorting by start date (newest first)."""
-        return self.start_date_obj > other.start_date_obj
+    def __post_init__(self):
+        # Platform and tags repeat across many events, so share one string object each
+        self.platform = sys.intern(self.platform)
+        self.tags = [sys.intern(t) for t in self.tags or []]
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "title": self.title,
-            "start_date": self.start_date,
-            "end_date": self.end_date,
-            "location": self.location,
-            "url": self.url,
-            "platform": self.platform,
-            "is_online": self.is_online,
-            "is_california": self.is_california,
-            "prize": self.prize,
-            "tags": self.tags
-        }
+    @property
+    def start_date_obj(self) -> date:
+        """Parsed start date for sorting; a property so it stays out of the JSON output."""
+        # fromisoformat is much faster than strptime
+        try:
+            return date.fromisoformat(self.start_date)
+        except (ValueError, TypeError):
+            return date.max
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'HackathonEvent':
         """Create instance from dictionary."""
-        return cls(
-            title=data["title"],
-            start_date=data["start_date"],
-            end_date=data["end_date"],
-            location=data["location"],
-            url=data["url"],
-            platform=data["platform"],
-            is_online=data["is_online"],
-            is_california=data["is_california"],
-            prize=data.get("prize"),
-            tags=data.get("tags", [])
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
+def _write_atomic(path: str, data: bytes, ignore: Optional[re.Pattern] = None) -> bool:
+    """Write a file via a temp file and rename so readers never see partial content.
+    
+    The write is skipped when the file already holds the same content (compared
+    with any ``ignore`` matches removed). Returns True if the file was written.
+    """
+    try:
+        with open(path, 'rb') as f:
+            current = f.read()
+    except OSError:
+        current = None
+    if current is not None:
+        if ignore is not None:
+            current, compared = ignore.sub(b"", current), ignore.sub(b"", data)
+        else:
+            compared = data
+        if current == compared:
+            return False
+    
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def _format_rows(hackathons: List[HackathonEvent], column_attr: str) -> str:
+    """Render README table rows, filling the third column from column_attr."""
+    return "\n".join(
+        README_ROW_TEMPLATE.format(
+            title=h.title,
+            url=h.url,
+            date_str=f"{h.start_date} - {h.end_date}" if h.end_date else h.start_date,
+            column=getattr(h, column_attr)
         )
+        for h in hackathons
+    )
 
 
 class HackathonCollector:
     """Base class for collecting hackathon data from APIs."""
     
-    def __init__(self, api_key: str = ""):
+    def __init__(self, api_key: str = "", http_cache: Optional[HttpCache] = None):
         self.api_key = api_key
+        self.http_cache = http_cache
+        # Built once and reused for every request made by this collector
+        self.headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+    
+    async def fetch_json(self, session: RetryClient, url: str) -> Any:
+        """GET a JSON payload, reusing the cached copy when the API reports it unchanged."""
+        if self.http_cache is None:
+            async with session.get(url, headers=self.headers) as response:
+                response.raise_for_status()
+                return orjson.loads(await response.read())
+        
+        validators = self.http_cache.conditional_headers(url)
+        async with session.get(url, headers={**self.headers, **validators}) as response:
+            not_modified = response.status == 304
+            if not not_modified:
+                response.raise_for_status()
+                body = await response.read()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        
+        if not_modified:
+            try:
+                payload = self.http_cache.load_payload(url)
+            except OSError:
+                if not validators:
+                    raise
+                # The payload vanished after the validators were sent; refetch without them
+                logger.warning(f"Cached payload for {url} is missing, refetching")
+                self.http_cache.drop(url)
+                return await self.fetch_json(session, url)
+            logger.info(f"{url} not modified, using cached payload")
+            return payload
         
-    def fetch_hackathons(self) -> List[HackathonEvent]:
+        body_hash = hashlib.sha256(body).hexdigest()
+        if body_hash == self.http_cache.body_hash(url) and self.http_cache.has_payload(url):
+            payload = self.http_cache.load_payload(url)
+        else:
+            payload = orjson.loads(body)
+        self.http_cache.store(url, etag, last_modified, body_hash, payload)
+        return payload
+    
+    async def fetch_hackathons(self, session: RetryClient) -> List[HackathonEvent]:
         """Fetch hackathons from the API. To be implemented by subclasses."""
         raise NotImplementedError("Subclasses must implement fetch_hackathons")
 
@@ -117,23 +260,26 @@ class HackathonCollector:
 class DevpostCollector(HackathonCollector):
     """Collector for Devpost hackathons."""
     
-    def fetch_hackathons(self) -> List[HackathonEvent]:
+    async def fetch_hackathons(self, session: RetryClient) -> List[HackathonEvent]:
         """Fetch hackathons from Devpost API."""
         logger.info("Fetching hackathons from Devpost API")
         try:
             # In a real implementation, this would use the actual Devpost API
             # For now, we'll simulate the API response
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-                
-            # Simulated API call
-            # response = requests.get(
-            #     f"{DEVPOST_API_BASE}?filter=online&sort=newest",
-            #     headers=headers
-            # )
-            # response.raise_for_status()
-            # data = response.json()
+            
+            # Simulated API call: one bulk listing request, following the
+            # page cursor only while the API reports more results
+            # data = []
+            # page = 1
+            # while True:
+            #     payload = await self.fetch_json(
+            #         session,
+            #         f"{DEVPOST_API_BASE}?filter=online&per_page=100&order_by=recently-added&page={page}"
+            #     )
+            #     data.extend(payload["hackathons"])
+            #     if not payload.get("has_more"):
+            #         break
+            #     page += 1
             
             # Simulated data for demonstration
             simulated_data = [
@@ -179,7 +325,7 @@ class DevpostCollector(HackathonCollector):
                     url=item["url"],
                     platform=item["platform"],
                     is_online=item["is_online"],
-                    is_california="California" in item["location"],
+                    is_california=bool(CALIFORNIA_LOCATION_RE.search(item["location"])),
                     prize=item.get("prize"),
                     tags=item.get("tags", [])
                 )
@@ -193,23 +339,19 @@ class DevpostCollector(HackathonCollector):
 class MLHCollector(HackathonCollector):
     """Collector for MLH hackathons."""
     
-    def fetch_hackathons(self) -> List[HackathonEvent]:
+    async def fetch_hackathons(self, session: RetryClient) -> List[HackathonEvent]:
         """Fetch hackathons from MLH API."""
         logger.info("Fetching hackathons from MLH API")
         try:
             # In a real implementation, this would use the actual MLH API
             # For now, we'll simulate the API response
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-                
-            # Simulated API call
-            # response = requests.get(
-            #     f"{MLH_API_BASE}?season=2025",
-            #     headers=headers
+            
+            # Simulated API call: the whole season in one request; events are
+            # classified as California/online client-side below
+            # data = await self.fetch_json(
+            #     session,
+            #     f"{MLH_API_BASE}?season=2025"
             # )
-            # response.raise_for_status()
-            # data = response.json()
             
             # Simulated data for demonstration
             simulated_data = [
@@ -264,7 +406,7 @@ class MLHCollector(HackathonCollector):
                     url=item["url"],
                     platform=item["platform"],
                     is_online=item["is_online"],
-                    is_california=item.get("is_california", False),
+                    is_california=bool(CALIFORNIA_LOCATION_RE.search(item["location"])),
                     tags=item.get("tags", [])
                 )
                 for item in simulated_data
@@ -277,7 +419,11 @@ class MLHCollector(HackathonCollector):
 class LumaCollector(HackathonCollector):
     """Collector for Lu.ma hackathons."""
     
-    def fetch_hackathons(self) -> List[HackathonEvent]:
+    def __init__(self, api_key: str = "", http_cache: Optional[HttpCache] = None):
+        super().__init__(api_key, http_cache)
+        self.headers = {"x-luma-api-key": api_key} if api_key else {}
+    
+    async def fetch_hackathons(self, session: RetryClient) -> List[HackathonEvent]:
         """Fetch hackathons from Lu.ma API."""
         logger.info("Fetching hackathons from Lu.ma API")
         try:
@@ -286,18 +432,17 @@ class LumaCollector(HackathonCollector):
             if not self.api_key:
                 logger.warning("No Lu.ma API key provided, skipping")
                 return []
-                
-            headers = {
-                "x-luma-api-key": self.api_key
-            }
-                
-            # Simulated API call
-            # response = requests.get(
-            #     f"{LUMA_API_BASE}/calendar/list-events?filter=hackathon",
-            #     headers=headers
+            
+            # Simulated API call: a single list request; all event details
+            # are read from the list payload, no per-event lookups
+            # payload = await self.fetch_json(
+            #     session,
+            #     f"{LUMA_API_BASE}/calendar/list-events?limit=100"
             # )
-            # response.raise_for_status()
-            # data = response.json()
+            # data = [
+            #     entry["event"] for entry in payload["entries"]
+            #     if "hackathon" in entry["event"]["name"].lower()
+            # ]
             
             # Simulated data for demonstration
             simulated_data = [
@@ -333,7 +478,7 @@ class LumaCollector(HackathonCollector):
                     url=item["url"],
                     platform=item["platform"],
                     is_online=item["is_online"],
-                    is_california=item.get("is_california", False),
+                    is_california=bool(CALIFORNIA_LOCATION_RE.search(item["location"])),
                     tags=item.get("tags", [])
                 )
                 for item in simulated_data
@@ -346,23 +491,18 @@ class LumaCollector(HackathonCollector):
 class DevEventsCollector(HackathonCollector):
     """Collector for dev.events hackathons."""
     
-    def fetch_hackathons(self) -> List[HackathonEvent]:
+    async def fetch_hackathons(self, session: RetryClient) -> List[HackathonEvent]:
         """Fetch hackathons from dev.events API."""
         logger.info("Fetching hackathons from dev.events API")
         try:
             # In a real implementation, this would use the actual dev.events API
             # For now, we'll simulate the API response
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-                
-            # Simulated API call
-            # response = requests.get(
-            #     f"{DEV_EVENTS_API_BASE}/NA/US/CA",
-            #     headers=headers
+            
+            # Simulated API call: the regional list covers all California events
+            # data = await self.fetch_json(
+            #     session,
+            #     f"{DEV_EVENTS_API_BASE}/NA/US/CA"
             # )
-            # response.raise_for_status()
-            # data = response.json()
             
             # Simulated data for demonstration
             simulated_data = [
@@ -388,7 +528,7 @@ class DevEventsCollector(HackathonCollector):
                     url=item["url"],
                     platform=item["platform"],
                     is_online=item["is_online"],
-                    is_california=item["is_california"],
+                    is_california=bool(CALIFORNIA_LOCATION_RE.search(item["location"])),
                     tags=item.get("tags", [])
                 )
                 for item in simulated_data
@@ -406,23 +546,72 @@ class HackathonUpdater:
         self.data_file = data_file
         self.hackathons = []
         
-    def collect_all_hackathons(self) -> List[HackathonEvent]:
-        """Collect hackathons from all sources."""
+    async def _collect(self, collector: HackathonCollector, session: RetryClient) -> List[HackathonEvent]:
+        """Fetch from one collector, giving up after COLLECTOR_TIMEOUT seconds."""
+        try:
+            return await asyncio.wait_for(collector.fetch_hackathons(session), COLLECTOR_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(f"{type(collector).__name__} timed out after {COLLECTOR_TIMEOUT}s, skipping")
+            return []
+    
+    async def collect_all_hackathons(self) -> List[HackathonEvent]:
+        """Collect hackathons from all sources concurrently."""
+        retry_options = ExponentialRetry(
+            attempts=RETRY_ATTEMPTS,
+            start_timeout=RETRY_START_TIMEOUT,
+            exceptions={aiohttp.ClientConnectionError}
+        )
+        # Share one session so all collectors reuse the same connection pool
+        async with RetryClient(retry_options=retry_options) as session:
+            tasks = [asyncio.create_task(self._collect(collector, session)) for collector in self.collectors]
+            for done_count, next_done in enumerate(asyncio.as_completed(tasks), start=1):
+                hackathons = await next_done
+                logger.info(f"Received {len(hackathons)} hackathons ({done_count}/{len(tasks)} sources done)")
+        
+        # Merge in collector order so the output is stable regardless of response timing
         all_hackathons = []
-        for collector in self.collectors:
-            hackathons = collector.fetch_hackathons()
-            all_hackathons.extend(hackathons)
+        for task in tasks:
+            all_hackathons.extend(task.result())
         return all_hackathons
     
+    def _dedup(self, hackathons: List[HackathonEvent]) -> List[HackathonEvent]:
+        """Merge hackathons listed by more than one source into a single record.
+        
+        Events match on normalized title and exact start date; listings of the
+        same event with different start dates are kept separate.
+        """
+        merged: Dict[tuple, HackathonEvent] = {}
+        for h in hackathons:
+            key = (re.sub(r'\W+', '', h.title.lower()), h.start_date)
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = h
+                continue
+            
+            # Keep the latest end date, union of tags and first known prize
+            if h.end_date and (not existing.end_date or h.end_date > existing.end_date):
+                existing.end_date = h.end_date
+            existing.tags = existing.tags + [t for t in h.tags if t not in existing.tags]
+            existing.prize = existing.prize or h.prize
+            existing.is_california = existing.is_california or h.is_california
+            existing.is_online = existing.is_online or h.is_online
+        
+        return list(merged.values())
+    
     def filter_and_sort_hackathons(self, hackathons: List[HackathonEvent]) -> Dict[str, List[HackathonEvent]]:
         """Filter and sort hackathons by category."""
         # Sort all hackathons by start date (newest first)
-        sorted_hackathons = sorted(hackathons)
+        sorted_hackathons = sorted(hackathons, key=attrgetter("start_date_obj"), reverse=True)
         
-        # Filter by category
-        california_hackathons = [h for h in sorted_hackathons if h.is_california]
-        online_hackathons = [h for h in sorted_hackathons if h.is_online]
-        other_hackathons = [h for h in sorted_hackathons if not h.is_california and not h.is_online]
+        # Filter by category in a single pass (an event can be both California and online)
+        california_hackathons, online_hackathons, other_hackathons = [], [], []
+        for h in sorted_hackathons:
+            if h.is_california:
+                california_hackathons.append(h)
+            if h.is_online:
+                online_hackathons.append(h)
+            if not h.is_california and not h.is_online:
+                other_hackathons.append(h)
         
         return {
             "california": california_hackathons,
@@ -432,13 +621,12 @@ class HackathonUpdater:
     
     def save_hackathons_to_json(self, categorized_hackathons: Dict[str, List[HackathonEvent]]) -> None:
         """Save hackathons to JSON file."""
-        data = {
-            category: [h.to_dict() for h in hackathons]
-            for category, hackathons in categorized_hackathons.items()
-        }
+        # orjson serializes the HackathonEvent dataclasses directly
+        data = orjson.dumps(categorized_hackathons, option=orjson.OPT_INDENT_2)
         
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        if not _write_atomic(self.data_file, data):
+            logger.info(f"{self.data_file} is unchanged, skipping write")
+            return
         
         logger.info(f"Saved hackathon data to {self.data_file}")
     
@@ -513,29 +701,15 @@ Special thanks to everyone who organizes and sponsors hackathons, making these o
 """
         
         # Format hackathon rows
-        california_rows = []
-        for h in categorized_hackathons["california"]:
-            date_str = f"{h.start_date} - {h.end_date}" if h.end_date else h.start_date
-            row = f"| **[{h.title}]({h.url})** | {date_str} | {h.location} | <a href=\"{h.url}\" target=\"_blank\"><img src=\"https://i.imgur.com/w6lyvuC.png\" width=\"84\" alt=\"Apply\"></a> |"
-            california_rows.append(row)
-        
-        online_rows = []
-        for h in categorized_hackathons["online"]:
-            date_str = f"{h.start_date} - {h.end_date}" if h.end_date else h.start_date
-            row = f"| **[{h.title}]({h.url})** | {date_str} | {h.platform} | <a href=\"{h.url}\" target=\"_blank\"><img src=\"https://i.imgur.com/w6lyvuC.png\" width=\"84\" alt=\"Apply\"></a> |"
-            online_rows.append(row)
-        
-        other_rows = []
-        for h in categorized_hackathons["other"]:
-            date_str = f"{h.start_date} - {h.end_date}" if h.end_date else h.start_date
-            row = f"| **[{h.title}]({h.url})** | {date_str} | {h.location} | <a href=\"{h.url}\" target=\"_blank\"><img src=\"https://i.imgur.com/w6lyvuC.png\" width=\"84\" alt=\"Apply\"></a> |"
-            other_rows.append(row)
+        california_rows = _format_rows(categorized_hackathons["california"], "location")
+        online_rows = _format_rows(categorized_hackathons["online"], "platform")
+        other_rows = _format_rows(categorized_hackathons["other"], "location")
         
         # Fill in template
         content = template.format(
-            california_hackathons="\n".join(california_rows) if california_rows else "| No California hackathons found | | | |",
-            online_hackathons="\n".join(online_rows) if online_rows else "| No online hackathons found | | | |",
-            other_hackathons="\n".join(other_rows) if other_rows else "| No other hackathons found | | | |",
+            california_hackathons=california_rows or "| No California hackathons found | | | |",
+            online_hackathons=online_rows or "| No online hackathons found | | | |",
+            other_hackathons=other_rows or "| No other hackathons found | | | |",
             update_date=datetime.now().strftime("%Y-%m-%d")
         )
         
@@ -545,8 +719,10 @@ Special thanks to everyone who organizes and sponsors hackathons, making these o
         """Update README.md with hackathon tables."""
         content = self.generate_readme_content(categorized_hackathons)
         
-        with open("README.md", 'w') as f:
-            f.write(content)
+        # The timestamp alone does not count as a change
+        if not _write_atomic("README.md", content.encode(), ignore=README_UPDATE_DATE_RE):
+            logger.info("README.md is unchanged, skipping write")
+            return
         
         logger.info("Updated README.md with hackathon tables")
     
@@ -566,48 +742,53 @@ This file contains past hackathons that are no longer active.
 
 """
         
-        with open("ARCHIVE.md", 'w') as f:
-            f.write(content)
+        if not _write_atomic("ARCHIVE.md", content.encode()):
+            logger.info("ARCHIVE.md is unchanged, skipping write")
+            return
         
         logger.info("Updated ARCHIVE.md with past hackathons")
     
-    def run(self) -> None:
+    async def run(self) -> None:
         """Run the hackathon update process."""
         logger.info("Starting hackathon update process")
         
         # Collect hackathons from all sources
-        all_hackathons = self.collect_all_hackathons()
+        all_hackathons = await self.collect_all_hackathons()
         logger.info(f"Collected {len(all_hackathons)} hackathons from all sources")
         
+        # Merge duplicates listed by more than one source
+        all_hackathons = self._dedup(all_hackathons)
+        logger.info(f"{len(all_hackathons)} unique hackathons after deduplication")
+        
         # Filter and sort hackathons
         categorized_hackathons = self.filter_and_sort_hackathons(all_hackathons)
         logger.info(f"Categorized hackathons: {len(categorized_hackathons['california'])} California, {len(categorized_hackathons['online'])} online, {len(categorized_hackathons['other'])} other")
         
-        # Save hackathons to JSON
-        self.save_hackathons_to_json(categorized_hackathons)
-        
-        # Update README.md
-        self.update_readme(categorized_hackathons)
-        
-        # Update ARCHIVE.md
-        self.update_archive(categorized_hackathons)
+        # Save hackathons to JSON and update README.md and ARCHIVE.md; each step
+        # writes a different file, so they can run in parallel threads
+        await asyncio.gather(
+            asyncio.to_thread(self.save_hackathons_to_json, categorized_hackathons),
+            asyncio.to_thread(self.update_readme, categorized_hackathons),
+            asyncio.to_thread(self.update_archive, categorized_hackathons)
+        )
         
         logger.info("Hackathon update process completed successfully")
 
 
 def main():
     """Main function to run the hackathon updater."""
-    # Create collectors for each source
+    # Create collectors for each source, sharing one on-disk HTTP cache
+    http_cache = HttpCache()
     collectors = [
-        DevpostCollector(API_KEYS["devpost"]),
-        MLHCollector(API_KEYS["mlh"]),
-        LumaCollector(API_KEYS["luma"]),
-        DevEventsCollector(API_KEYS["dev_events"])
+        DevpostCollector(API_KEYS["devpost"], http_cache),
+        MLHCollector(API_KEYS["mlh"], http_cache),
+        LumaCollector(API_KEYS["luma"], http_cache),
+        DevEventsCollector(API_KEYS["dev_events"], http_cache)
     ]
     
     # Create and run updater
     updater = HackathonUpdater(collectors)
-    updater.run()
+    asyncio.run(updater.run())
 
 
 if __name__ == "__main__":